@@ -35,6 +35,9 @@ from orion_tts_generator import OrionTTSGenerator  # type: ignore  # noqa: E402
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
 
+# Files smaller than this are truncated/empty responses, not usable audio
+MIN_AUDIO_BYTES = 1024
+
 
 def load_md_segments(md_path: Path, limit: int | None = None) -> list[str]:
     """Load plain text lines from MD file.
@@ -278,14 +281,17 @@ def generate_tts_for_episode(
         # Output filename
         output_file = output_dir / f"{episode_name}_{segment_no:03d}.mp3"
 
-        # Skip if file already exists
-        if output_file.exists():
-            file_size = output_file.stat().st_size / 1024  # KB
+        # Skip if file already exists (and is not a truncated leftover)
+        existing_size = output_file.stat().st_size if output_file.exists() else 0
+        if existing_size >= MIN_AUDIO_BYTES:
             logger.info("")
             logger.info("[%03d/%03d] ⏭️  Skipping (already exists): %s (%.1f KB)",
-                       segment_no, len(segments), output_file.name, file_size)
+                       segment_no, len(segments), output_file.name, existing_size / 1024)
             success += 1
             continue
+        if existing_size:
+            logger.warning("[%03d/%03d] ⚠️  Regenerating truncated file: %s (%d bytes)",
+                           segment_no, len(segments), output_file.name, existing_size)
 
         logger.info("")
         logger.info("[%03d/%03d] Generating: %s", segment_no, len(segments), output_file.name)
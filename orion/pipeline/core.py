@@ -118,6 +118,7 @@ class PipelineContext:
     timeline_xml: Optional[Path] = None
     merged_srt: Optional[Path] = None
     audio_dir: Optional[Path] = None
+    tts_cache_dir: Optional[Path] = None  # None disables the TTS audio cache
 
     # Configuration
     config: PipelineConfig = field(default_factory=PipelineConfig)
@@ -177,6 +178,7 @@ class PipelineContext:
         timeline_xml = output_dir / f"{args.project}_timeline.xml"
         merged_srt = exports_dir / f"{snake_name}_merged.srt"
         audio_dir = output_dir / "audio"
+        tts_cache_dir = project_dir / ".cache" / "tts" if getattr(args, "tts_cache", False) else None
 
         return cls(
             project=args.project,
@@ -196,6 +198,7 @@ class PipelineContext:
             timeline_xml=timeline_xml,
             merged_srt=merged_srt,
             audio_dir=audio_dir,
+            tts_cache_dir=tts_cache_dir,
             config=config,
         )
 
@@ -203,9 +206,10 @@ class PipelineContext:
     def _find_file(directory: Path, *patterns: str) -> Optional[Path]:
         """Find first file matching any of the patterns."""
         for pattern in patterns:
-            matches = list(directory.glob(pattern))
-            if matches:
-                return matches[0]
+            # Stop at the first hit instead of listing every match
+            match = next(directory.glob(pattern), None)
+            if match is not None:
+                return match
         return None
 
     @staticmethod
@@ -355,7 +359,8 @@ def run_pipeline(ctx: PipelineContext) -> bool:
             print(f"  → Request delay: {ctx.config.tts_request_delay}s (quota protection)")
             tts_engine = TTSEngine(
                 use_existing=False,
-                request_delay_sec=ctx.config.tts_request_delay
+                request_delay_sec=ctx.config.tts_request_delay,
+                cache_dir=ctx.tts_cache_dir
             )
 
         ctx.audio_dir.mkdir(parents=True, exist_ok=True)
@@ -653,6 +658,12 @@ Examples:
         help="Overwrite existing generated artifacts during preprocessing"
     )
 
+    parser.add_argument(
+        "--tts-cache",
+        action="store_true",
+        help="Reuse previously synthesized TTS audio from <project>/.cache/tts (off by default)"
+    )
+
     parser.add_argument(
         "--apply-generated-inputs",
         action="store_true",
@@ -142,8 +142,9 @@ def is_fuzzy_match(text1: str, text2: str, threshold: float = 0.8) -> bool:
     if text1 in text2 or text2 in text1:
         return True
 
-    # Calculate overlap ratio
-    overlap = sum(1 for c in text1 if c in text2)
+    # Calculate overlap ratio (set membership keeps this linear)
+    text2_chars = set(text2)
+    overlap = sum(1 for c in text1 if c in text2_chars)
     ratio = overlap / max(len(text1), len(text2), 1)
 
     return ratio >= threshold
@@ -46,6 +46,8 @@ class OrionTTSGenerator:
             except (TypeError, ValueError):
                 self._request_delay_sec = 0.0
         self._gemini_client = None
+        # (model, prompt) -> rewritten text; repeated lines skip the Gemini round-trip
+        self._rewrite_cache: Dict[tuple[str, str], str] = {}
 
     def generate(
         self,
@@ -225,6 +227,11 @@ class OrionTTSGenerator:
         scene_note = f"Scene context: {scene}" if scene else ""
         prompt = "\n".join([prompt_header, scene_note, "---", text.strip(), "---"]).strip()
 
+        cache_key = (model, prompt)
+        cached = self._rewrite_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             response = self._gemini_client.models.generate_content(
                 model=model,
@@ -233,6 +240,7 @@ class OrionTTSGenerator:
             rewritten = self._extract_response_text(response)
             if rewritten:
                 logger.debug("Gemini rewrote dialogue for %s: %s", character, rewritten)
+                self._rewrite_cache[cache_key] = rewritten
                 return rewritten
             logger.warning("Gemini returned empty rewrite for %s; falling back to original text.", character)
         except Exception as exc:
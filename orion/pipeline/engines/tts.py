@@ -6,24 +6,36 @@ Provides a mode to use pre-generated audio files to save API quota.
 """
 from __future__ import annotations
 
+import hashlib
+import importlib.util
 import json
+import shutil
 import subprocess
+import tempfile
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 
-try:
-    from google import genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
+
+def _module_available(name: str) -> bool:
+    """Check whether a module is importable without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        return False
+
+
+# The Google SDKs are heavy to import and only needed when generating audio,
+# so they are imported on first use (see TTSEngine.__init__).
+GEMINI_AVAILABLE = _module_available("google.genai")
+GOOGLE_TTS_AVAILABLE = _module_available("google.cloud.texttospeech")
 
 try:
-    from google.cloud import texttospeech
-    GOOGLE_TTS_AVAILABLE = True
+    from mutagen import File as MutagenFile
+    MUTAGEN_AVAILABLE = True
 except ImportError:
-    GOOGLE_TTS_AVAILABLE = False
+    MUTAGEN_AVAILABLE = False
 
 import sys
 import os
@@ -32,6 +44,13 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Gemini TTS defaults (also part of the audio cache key)
+GEMINI_TTS_MODEL = "gemini-2.5-flash-preview-tts"
+GEMINI_TTS_VOICE = "Aoede"  # Default Japanese voice
+
+# Cached files smaller than this are truncated/empty and are ignored
+MIN_AUDIO_BYTES = 1024
+
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent
 sys.path.insert(0, str(REPO_ROOT))
 
@@ -80,7 +99,10 @@ class AudioSegment:
 
 
 def probe_audio_metadata(audio_path: Path) -> tuple[float, int]:
-    """Probe audio file metadata using ffprobe.
+    """Probe audio file metadata using mutagen, falling back to ffprobe.
+
+    mutagen reads the container headers in-process; ffprobe is only spawned
+    when mutagen is unavailable or cannot parse the file.
 
     Args:
         audio_path: Path to audio file
@@ -91,6 +113,14 @@ def probe_audio_metadata(audio_path: Path) -> tuple[float, int]:
     Raises:
         RuntimeError: If ffprobe fails
     """
+    if MUTAGEN_AVAILABLE:
+        try:
+            audio = MutagenFile(str(audio_path))
+            if audio is not None and audio.info.length > 0:
+                return float(audio.info.length), int(audio.info.sample_rate)
+        except Exception as exc:
+            logger.debug("mutagen could not read %s: %s", audio_path, exc)
+
     cmd = [
         "ffprobe",
         "-v", "error",
@@ -129,7 +159,8 @@ class TTSEngine:
         self,
         use_existing: bool = True,
         existing_audio_dir: Optional[Path] = None,
-        request_delay_sec: float = 5.0
+        request_delay_sec: float = 5.0,
+        cache_dir: Optional[Path] = None
     ):
         """Initialize TTS engine.
 
@@ -137,10 +168,12 @@ class TTSEngine:
             use_existing: If True, use existing audio files
             existing_audio_dir: Directory with pre-generated audio files
             request_delay_sec: Delay between TTS requests to avoid quota limits
+            cache_dir: Content-addressed audio cache (keyed on text/model/voice)
         """
         self.use_existing = use_existing
         self.existing_audio_dir = existing_audio_dir
         self.request_delay_sec = request_delay_sec
+        self.cache_dir = cache_dir
 
         self._gemini_client = None
         self._google_tts_client = None
@@ -148,16 +181,24 @@ class TTSEngine:
         # Initialize APIs if not using existing files
         if not self.use_existing:
             if GEMINI_AVAILABLE:
-                # Try both GEMINI_API_KEY and GOOGLE_API_KEY
-                api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
-                if api_key:
-                    self._gemini_client = genai.Client(api_key=api_key)
-                    print(f"  ✅ Gemini API configured")
-                else:
-                    print(f"  ⚠️  GEMINI_API_KEY/GOOGLE_API_KEY not found")
+                try:
+                    from google import genai
+                except ImportError as e:
+                    # Installed but broken (e.g. dependency version mismatch)
+                    genai = None
+                    print(f"  ⚠️  Gemini SDK unavailable: {e}")
+                if genai is not None:
+                    # Try both GEMINI_API_KEY and GOOGLE_API_KEY
+                    api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+                    if api_key:
+                        self._gemini_client = genai.Client(api_key=api_key)
+                        print(f"  ✅ Gemini API configured")
+                    else:
+                        print(f"  ⚠️  GEMINI_API_KEY/GOOGLE_API_KEY not found")
 
             if GOOGLE_TTS_AVAILABLE:
                 try:
+                    from google.cloud import texttospeech
                     self._google_tts_client = texttospeech.TextToSpeechClient()
                     print(f"  ✅ Google Cloud TTS configured (fallback)")
                 except Exception as e:
@@ -209,6 +250,27 @@ class TTSEngine:
                             f"  [{segment.index:03d}] ⚠️  Failed to use existing: {e}"
                         )
 
+            # Reuse audio synthesized earlier for identical text
+            cache_path = self._cache_path(segment.text)
+            if cache_path and cache_path.exists() and cache_path.stat().st_size >= MIN_AUDIO_BYTES:
+                try:
+                    shutil.copyfile(cache_path, output_path)
+                    audio_seg = AudioSegment.from_existing_file(
+                        index=segment.index,
+                        text=segment.text,
+                        audio_path=output_path
+                    )
+                    audio_segments.append(audio_seg)
+                    print(
+                        f"  [{segment.index:03d}] ♻️  Cached: "
+                        f"{filename} ({audio_seg.duration_sec:.2f}s)"
+                    )
+                    continue
+                except Exception as e:
+                    print(
+                        f"  [{segment.index:03d}] ⚠️  Failed to use cache: {e}"
+                    )
+
             # Generate new audio with Gemini TTS
             try:
                 audio_seg = self._generate_gemini_tts(
@@ -234,6 +296,32 @@ class TTSEngine:
 
         return audio_segments
 
+    def _cache_path(self, text: str) -> Optional[Path]:
+        """Return the cache file for a segment's text, or None if caching is off."""
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha256(
+            f"{GEMINI_TTS_MODEL}|{GEMINI_TTS_VOICE}|{text}".encode("utf-8")
+        ).hexdigest()
+        return self.cache_dir / f"{key}.mp3"
+
+    @staticmethod
+    def _store_in_cache(audio_path: Path, cache_path: Path) -> None:
+        """Copy audio into the cache atomically (temp file + os.replace).
+
+        A run killed mid-copy leaves only a stray temp file, never a
+        truncated cache entry.
+        """
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(audio_path, tmp_name)
+            os.replace(tmp_name, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache {audio_path.name}: {e}")
+            Path(tmp_name).unlink(missing_ok=True)
+
     def _generate_gemini_tts(
         self,
         segment,  # NarrationSegment
@@ -258,6 +346,10 @@ class TTSEngine:
             try:
                 success = self._try_gemini_tts(segment.text, output_path)
                 if success:
+                    # Only Gemini output is cached; fallback voices differ
+                    cache_path = self._cache_path(segment.text)
+                    if cache_path:
+                        self._store_in_cache(output_path, cache_path)
                     duration_sec, sample_rate = probe_audio_metadata(output_path)
                     return AudioSegment(
                         index=segment.index,
@@ -301,8 +393,8 @@ class TTSEngine:
         Returns:
             True if successful, False otherwise
         """
-        tts_model = "gemini-2.5-flash-preview-tts"
-        voice_name = "Aoede"  # Default Japanese voice
+        tts_model = GEMINI_TTS_MODEL
+        voice_name = GEMINI_TTS_VOICE
 
         max_attempts = 5
         for attempt in range(1, max_attempts + 1):
@@ -375,6 +467,8 @@ class TTSEngine:
         Returns:
             True if successful, False otherwise
         """
+        from google.cloud import texttospeech
+
         synthesis_input = texttospeech.SynthesisInput(text=text)
 
         voice = texttospeech.VoiceSelectionParams(
@@ -14,6 +14,15 @@ from typing import List, Optional
 import yaml
 
 
+# Lines that never become narration: comments/headings (#...) and horizontal rules
+_NON_NARRATION_RE = re.compile(r"#|[-—━─]{3,}$")
+
+# Time-coded section header: 【HH:MM-HH:MM】タイトル
+_SECTION_HEADER_RE = re.compile(r"【\d{2}:\d{2}-\d{2}:\d{2}】")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 @dataclass
 class NarrationSegment:
     """Represents a single narration segment for TTS."""
@@ -29,7 +38,7 @@ class NarrationSegment:
 
     def char_count(self) -> int:
         """Count characters excluding whitespace."""
-        return len(re.sub(r"\s", "", self.text))
+        return len(_WHITESPACE_RE.sub("", self.text))
 
     def audio_filename(self, project: str) -> str:
         """Generate audio filename for this segment.
@@ -76,16 +85,8 @@ def parse_narration_markdown(content: str) -> List[NarrationSegment]:
         if not line:
             continue
 
-        # Skip comments
-        if line.startswith("#"):
-            continue
-
-        # Skip markdown headings (##, ###, etc.)
-        if re.match(r"^#{1,6}\s+", line):
-            continue
-
-        # Skip horizontal rules
-        if re.fullmatch(r"[-—━─]{3,}", line):
+        # Skip comments, markdown headings and horizontal rules
+        if _NON_NARRATION_RE.match(line):
             continue
 
         # Create segment
@@ -215,7 +216,7 @@ def parse_script_section_markers(script_path: Path) -> List[int]:
 
         # Check if this is a time-coded section header
         # Pattern: 【HH:MM-HH:MM】タイトル
-        if re.match(r"^【\d{2}:\d{2}-\d{2}:\d{2}】", line_stripped):
+        if _SECTION_HEADER_RE.match(line_stripped):
             # This is a section header - mark the NEXT narration line
             # (narration_line_count + 1 because we haven't incremented yet)
             section_indices.append(narration_line_count + 1)
@@ -225,12 +226,8 @@ def parse_script_section_markers(script_path: Path) -> List[int]:
         if line_stripped.startswith("【テロップ】"):
             continue
 
-        # Check if this is a comment or heading (skip, not narration)
-        if line_stripped.startswith("#"):
-            continue
-
-        # Check if this is a horizontal rule (skip)
-        if re.fullmatch(r"[-—━─]{3,}", line_stripped):
+        # Check if this is a comment, heading or horizontal rule (skip, not narration)
+        if _NON_NARRATION_RE.match(line_stripped):
             continue
 
         # Check if this contains speaker annotation (e.g., "上司（男声・真剣に）：")
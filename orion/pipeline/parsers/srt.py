@@ -35,7 +35,7 @@ class Subtitle:
 
     def char_count(self) -> int:
         """Count characters excluding whitespace."""
-        return len(re.sub(r"\s", "", self.text)) or 1
+        return len(_WHITESPACE_RE.sub("", self.text)) or 1
 
     def line_count(self) -> int:
         """Count number of lines in subtitle."""
@@ -74,6 +74,9 @@ class Subtitle:
 # SRT timecode regex: HH:MM:SS,mmm
 _TIME_RE = re.compile(r"(\d{2}):(\d{2}):(\d{2}),(\d{3})")
 
+# Whitespace stripped for display character counts
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def time_to_ms(time_str: str) -> int:
     """Convert SRT timestamp to milliseconds.
@@ -151,6 +154,10 @@ def parse_srt(content: str) -> List[Subtitle]:
         >>> len(subtitles)
         2
     """
+    # Nothing to parse: skip the fence/split regex passes entirely
+    if not content.strip():
+        raise ValueError("No valid subtitle entries found")
+
     # Remove markdown code fences if present
     content = re.sub(r"```srt\s*", "", content)
     content = re.sub(r"```\s*$", "", content, flags=re.MULTILINE)
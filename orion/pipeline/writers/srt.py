@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import math
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Set
 from difflib import SequenceMatcher
@@ -15,6 +16,12 @@ from difflib import SequenceMatcher
 # Timeline framerate (NTSC drop-frame approximation used across pipeline)
 FPS = 29.97
 
+# normalize_text patterns (compiled once; called for every script line and cue)
+_SSML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+# Punctuation deletion table: one C-level pass via str.translate
+_PUNCTUATION_TABLE = str.maketrans('', '', '、。，．？！…—―「」『』（）')
+
 
 def srt_timecode_from_seconds(seconds: float) -> str:
     """Convert seconds to SRT timecode format.
@@ -55,14 +62,15 @@ def frames_to_srt_timecode(frames: int, fps: float = FPS) -> str:
     return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
 
 
+@lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
     """Normalize text for comparison (remove punctuation, whitespace, newlines, SSML tags)."""
     # Remove SSML tags (e.g., <sub alias='...'>, <break time='...'/>, etc.)
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _SSML_TAG_RE.sub('', text)
     # Remove all whitespace and newlines
-    text = re.sub(r'\s+', '', text)
+    text = _WHITESPACE_RE.sub('', text)
     # Remove common punctuation
-    text = re.sub(r'[、。，．？！…—―「」『』（）]', '', text)
+    text = text.translate(_PUNCTUATION_TABLE)
     return text
 
 
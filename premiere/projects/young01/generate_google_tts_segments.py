@@ -14,7 +14,9 @@ from google.cloud import texttospeech
 
 # Ensure we can import the shared TTS config utilities.
 REPO_ROOT = Path(__file__).resolve().parents[2]
-sys.path.append(str(REPO_ROOT / "experiments"))
+EXPERIMENTS_DIR = str(REPO_ROOT / "experiments")
+if EXPERIMENTS_DIR not in sys.path:
+    sys.path.append(EXPERIMENTS_DIR)
 
 from tts_config_loader import (  # type: ignore  # noqa: E402
     PronunciationHint,
@@ -3,10 +3,10 @@
 
 import os
 import base64
+from functools import lru_cache
 from pathlib import Path
 import yaml  # PyYAMLライブラリ
 import argparse
-from openai import OpenAI
 from dotenv import load_dotenv
 
 # .envファイルから環境変数を読み込む（このスクリプトのあるディレクトリを基準に探索）
@@ -26,14 +26,19 @@ DEFAULT_PROVIDER = os.getenv("LLM_PROVIDER", "openai").lower()
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-pro")
 
+@lru_cache(maxsize=1)
 def get_openai_client():
-    """OpenAIクライアントを初期化して返す（必要なときのみ）。"""
+    """OpenAIクライアントを初期化して返す（必要なときのみ、以降は同じインスタンスを再利用）。"""
     api_key = os.getenv("OPENAI_API_KEY")
     base_url = os.getenv("OPENAI_BASE_URL")  # 任意（OpenAI互換エンドポイント用）
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY が見つかりません。.env に 'OPENAI_API_KEY=sk-...' を設定してください。")
     try:
+        # openai はGeminiのみ使う場合に不要なので、初回利用時に読み込む
+        from openai import OpenAI
         return OpenAI(api_key=api_key, base_url=base_url) if base_url else OpenAI(api_key=api_key)
+    except ImportError:
+        raise RuntimeError("openai が未インストールです。'pip install openai' を実行してください。")
     except Exception as e:
         raise RuntimeError(f"OpenAIクライアント初期化に失敗: {e}")
 
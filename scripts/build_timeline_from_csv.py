@@ -53,7 +53,8 @@ def main() -> int:
     out_csv = pathlib.Path(sys.argv[2])
     project_dir = in_csv.parent.parent
 
-    rows_in = list(csv.DictReader(in_csv.open('r', encoding='utf-8')))
+    with in_csv.open('r', encoding='utf-8', newline='') as f:
+        rows_in = list(csv.DictReader(f))
     narr_dir = project_dir / 'サウンド類' / 'Narration'
 
     rows_out: List[Dict[str, str]] = []
@@ -5,7 +5,9 @@ import sys
 import os
 import subprocess
 
-sys.path.append("/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules/")
+RESOLVE_MODULES_DIR = "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules/"
+if RESOLVE_MODULES_DIR not in sys.path:
+    sys.path.append(RESOLVE_MODULES_DIR)
 
 try:
     import DaVinciResolveScript as dvr_script
@@ -117,14 +119,16 @@ def main():
     
     video_clips_found = 0
     for clip in all_clips:
-        file_path = clip.GetClipProperty("File Path")
+        # 引数なしで全プロパティを1回のAPI呼び出しで取得する
+        props = clip.GetClipProperty() or {}
+        file_path = props.get("File Path")
         
         if file_path and file_path.lower().endswith(VIDEO_EXTENSIONS):
             video_clips_found += 1
             clip_name = os.path.basename(file_path)
 
-            duration_tc = clip.GetClipProperty("Duration")
-            fps_prop = clip.GetClipProperty("FPS")
+            duration_tc = props.get("Duration")
+            fps_prop = props.get("FPS")
             
             if not all([duration_tc, fps_prop]):
                 print(f"⚠️  '{clip_name}' のDurationまたはFPSが空です。スキップします。")
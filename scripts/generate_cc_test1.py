@@ -70,7 +70,8 @@ def generate_ssml_audio():
             url,
             headers=headers,
             data=json.dumps(payload),
-            timeout=120  # v3 alphaは時間がかかる可能性
+            timeout=120,  # v3 alphaは時間がかかる可能性
+            stream=True,  # 音声はメモリに溜めずファイルへ直接書き出す
         )
 
         # エラーチェック
@@ -85,9 +86,10 @@ def generate_ssml_audio():
         output_file = output_dir / "cc_test1_v3_alpha_narration.mp3"
 
         with open(output_file, "wb") as f:
-            f.write(response.content)
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
 
-        file_size = len(response.content) / 1024 / 1024  # MB
+        file_size = output_file.stat().st_size / 1024 / 1024  # MB
         print(f"✅ 音声生成完了！")
         print(f"📁 出力ファイル: {output_file}")
         print(f"📊 ファイルサイズ: {file_size:.2f} MB")
@@ -14,7 +14,9 @@ from google import genai
 from google.genai import types
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.append(str(REPO_ROOT / "experiments"))
+EXPERIMENTS_DIR = str(REPO_ROOT / "experiments")
+if EXPERIMENTS_DIR not in sys.path:
+    sys.path.append(EXPERIMENTS_DIR)
 
 from tts_config_loader import annotate_text_with_hints, load_tts_config  # type: ignore
 
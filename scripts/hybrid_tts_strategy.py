@@ -4,6 +4,24 @@
 Google AI Studio手打ち品質 + 自動化のバランス
 """
 
+import re
+
+# 手動最適化推奨（感情・重要度が高い）
+CRITICAL_PATTERN = re.compile("|".join([
+    r'「.+?」',           # 台詞・引用
+    r'[？！]{1,3}',       # 感情表現
+    r'[\.]{2,}|——',      # 間・強調
+    r'(?:焦り|葛藤|不安|希望)', # 感情キーワード
+]))
+
+# 自動化可能（定型・説明文）
+TEMPLATE_PATTERN = re.compile("|".join([
+    r'\d+年|\d+時|\d+分',  # 時間・数値
+    r'について|において|による', # 接続詞
+    r'です|ます|である',   # 敬語・丁寧語
+]))
+
+
 class HybridTTSStrategy:
     """
     ハイブリッドTTS戦略:
@@ -19,20 +37,9 @@ class HybridTTSStrategy:
     def classify_content(self, script: str) -> dict:
         """コンテンツを手動/自動に分類"""
 
-        # 手動最適化推奨（感情・重要度が高い）
-        critical_patterns = [
-            r'「.+?」',           # 台詞・引用
-            r'[？！]{1,3}',       # 感情表現
-            r'[\.]{2,}|——',      # 間・強調
-            r'(焦り|葛藤|不安|希望)', # 感情キーワード
-        ]
-
-        # 自動化可能（定型・説明文）
-        template_patterns = [
-            r'\d+年|\d+時|\d+分',  # 時間・数値
-            r'について|において|による', # 接続詞
-            r'です|ます|である',   # 敬語・丁寧語
-        ]
+        # カテゴリごとに1回の走査でマッチ箇所を収集
+        self.critical_sections = [m.group(0) for m in CRITICAL_PATTERN.finditer(script)]
+        self.template_sections = [m.group(0) for m in TEMPLATE_PATTERN.finditer(script)]
 
         return {
             "critical": "手動最適化推奨",
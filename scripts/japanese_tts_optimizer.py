@@ -7,6 +7,18 @@ import re
 import unicodedata
 from typing import Dict, List, Tuple
 
+# 句読点・数字・整形用の正規表現（呼び出しごとのコンパイルを避ける）
+_SENTENCE_END_RE = re.compile(r'([。？！])\s*')
+_COMMA_RE = re.compile(r'、\s*')
+_DASH_RE = re.compile(r'——')
+_HOUR_RE = re.compile(r'(\d{1,2})時')
+_MINUTE_RE = re.compile(r'(\d{1,2})分')
+_YEAR_RE = re.compile(r'(\d+)年')
+_PAUSE_EMPHASIS_RE = re.compile(r'また一人、(.+?)。')
+_NEWLINES_RE = re.compile(r'\n+')
+_FULLWIDTH_SPACES_RE = re.compile(r'　+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 class JapaneseTTSOptimizer:
     """日本語音声合成最適化クラス"""
 
@@ -72,17 +84,14 @@ class JapaneseTTSOptimizer:
     def _optimize_punctuation(self, text: str) -> str:
         """句読点を音声向けに最適化"""
 
-        # 長い間を作る
-        text = re.sub(r'。\s*', '。　', text)  # 全角スペースで間を作る
-        text = re.sub(r'？\s*', '？　', text)
-        text = re.sub(r'！\s*', '！　', text)
+        # 長い間を作る（。？！の後に全角スペース）
+        text = _SENTENCE_END_RE.sub('\\1　', text)
 
         # 短い間
-        text = re.sub(r'、\s*', '、', text)
+        text = _COMMA_RE.sub('、', text)
 
-        # 強調のための間
-        text = re.sub(r'——', '　——　', text)
-        text = re.sub(r'『(.+?)』', '『\\1』', text)  # 強調記号はそのまま
+        # 強調のための間（『』の強調記号はそのまま）
+        text = _DASH_RE.sub('　——　', text)
 
         return text
 
@@ -90,11 +99,11 @@ class JapaneseTTSOptimizer:
         """数字の読み上げを最適化"""
 
         # 時刻
-        text = re.sub(r'(\d{1,2})時', lambda m: f"{self._number_to_japanese(int(m.group(1)))}じ", text)
-        text = re.sub(r'(\d{1,2})分', lambda m: f"{self._number_to_japanese(int(m.group(1)))}ふん", text)
+        text = _HOUR_RE.sub(lambda m: f"{self._number_to_japanese(int(m.group(1)))}じ", text)
+        text = _MINUTE_RE.sub(lambda m: f"{self._number_to_japanese(int(m.group(1)))}ふん", text)
 
         # 年数
-        text = re.sub(r'(\d+)年', lambda m: f"{self._number_to_japanese(int(m.group(1)))}ねん", text)
+        text = _YEAR_RE.sub(lambda m: f"{self._number_to_japanese(int(m.group(1)))}ねん", text)
 
         return text
 
@@ -120,7 +129,7 @@ class JapaneseTTSOptimizer:
             text = text.replace(emotion, reading)
 
         # 強調表現
-        text = re.sub(r'また一人、(.+?)。', r'また一人、　\\1。', text)  # 間を入れる
+        text = _PAUSE_EMPHASIS_RE.sub(r'また一人、　\\1。', text)  # 間を入れる
 
         return text
 
@@ -128,11 +137,11 @@ class JapaneseTTSOptimizer:
         """フォーマット整理"""
 
         # 改行を適切なスペースに変換
-        text = re.sub(r'\n+', '　', text)
+        text = _NEWLINES_RE.sub('　', text)
 
         # 連続スペース整理
-        text = re.sub(r'　+', '　', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = _FULLWIDTH_SPACES_RE.sub('　', text)
+        text = _WHITESPACE_RE.sub(' ', text)
 
         # 前後空白除去
         text = text.strip()
@@ -12,11 +12,13 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import logging
 import os
 import re
 import subprocess
 import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
@@ -24,6 +26,14 @@ import yaml
 from xml.dom import minidom
 import xml.etree.ElementTree as ET
 
+try:
+    from mutagen import File as MutagenFile
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MUTAGEN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parent
@@ -90,7 +100,18 @@ class Segment:
     gemini_style_prompt: Optional[str] = None
 
 
+# Cached files smaller than this are truncated/empty responses and get regenerated
+MIN_AUDIO_BYTES = 1024
+
 PAUSE_PATTERN = re.compile(r"\(間([0-9.]+)\)")
+REPEATED_COMMA_PATTERN = re.compile(r"、+")
+REPEATED_PERIOD_PATTERN = re.compile(r"。。+")
+
+# parse_script line classification (Markdown/decorative rules, 【tag】 lines, 話者：台詞)
+RULE_LINE_PATTERN = re.compile(r"-+|[ー~〜━‐－─—―]+")
+BRACKET_TAG_PATTERN = re.compile(r"^【([^】]+)】\s*(.*)$")
+DIALOGUE_PATTERN = re.compile(r"([^：]+)：")
+DIGIT_PATTERN = re.compile(r"\d")
 PAUSE_TO_PUNCT = {
     "0.4": "、",
     "0.5": "、",
@@ -117,8 +138,11 @@ QUESTION_SUFFIXES = (
 )
 
 
+_CAMEL_BOUNDARY_RE = re.compile("([a-z0-9])([A-Z])")
+
+
 def camel_to_snake(name: str) -> str:
-    snake = re.sub("([a-z0-9])([A-Z])", r"\1_\2", name)
+    snake = _CAMEL_BOUNDARY_RE.sub(r"\1_\2", name)
     snake = snake.replace("-", "_")
     return snake.lower()
 
@@ -165,19 +189,19 @@ def convert_pauses_to_text(raw: str, auto_finalize: bool) -> str:
 
     text = PAUSE_PATTERN.sub(repl, raw)
     text = text.replace(" ", "").replace("\u3000", "")
-    text = re.sub(r"、+", "、", text)
-    text = re.sub(r"。。+", "。", text)
+    text = REPEATED_COMMA_PATTERN.sub("、", text)
+    text = REPEATED_PERIOD_PATTERN.sub("。", text)
     text = text.strip()
     if not text:
         return text
 
-    suffix = ""
-    while text and text[-1] in "」』】）":
-        suffix = text[-1] + suffix
-        text = text[:-1]
+    # Peel trailing closing brackets in one pass (re-attached after punctuation)
+    body = text.rstrip("」』】）")
+    suffix = text[len(body):]
+    text = body
 
     if auto_finalize and text and text[-1] not in "。！？…♪":
-        if any(text.endswith(sfx) for sfx in QUESTION_SUFFIXES):
+        if text.endswith(QUESTION_SUFFIXES):
             text += "？"
         else:
             text += "。"
@@ -185,17 +209,21 @@ def convert_pauses_to_text(raw: str, auto_finalize: bool) -> str:
     return (text + suffix).strip()
 
 
+SPEAKER_ALIASES = {
+    "若手社員": "若手",
+    "若手/若手社員": "若手",
+}
+
+
+@lru_cache(maxsize=256)
 def normalize_speaker_label(label: str) -> str:
+    # Scripts reuse a handful of speaker labels across hundreds of lines.
     base = label.strip()
     if "/" in base:
         base = base.split("/", 1)[0]
     base = base.split("（", 1)[0]
     base = base.strip()
-    aliases = {
-        "若手社員": "若手",
-        "若手/若手社員": "若手",
-    }
-    return aliases.get(base, base)
+    return SPEAKER_ALIASES.get(base, base)
 
 
 def parse_script(ctx: PipelineContext) -> List[Segment]:
@@ -205,23 +233,21 @@ def parse_script(ctx: PipelineContext) -> List[Segment]:
     prev_scene: Optional[str] = None
     index = 1
 
-    dialogue_pattern = re.compile(r"([^：]+)：")
-
     lines_iter = iter(text.splitlines())
     for raw_line in lines_iter:
         line = raw_line.strip()
         if not line:
             continue
-        if re.fullmatch(r"-+", line) or re.fullmatch(r"[ー~〜━‐－─—―]+", line):
+        if RULE_LINE_PATTERN.fullmatch(line):
             # Skip Markdown or decorative horizontal rules (e.g., --- or ーーーー)
             continue
         if line.startswith("【"):
-            bracket_match = re.match(r"^【([^】]+)】\s*(.*)$", line)
+            bracket_match = BRACKET_TAG_PATTERN.match(line)
             if bracket_match:
                 tag, remainder = bracket_match.groups()
                 tag = (tag or "").strip()
                 remainder = (remainder or "").strip(" 。．.　")
-                is_scene_heading = bool(re.search(r"\d", tag)) or "scene" in tag.lower()
+                is_scene_heading = bool(DIGIT_PATTERN.search(tag)) or "scene" in tag.lower()
                 if is_scene_heading:
                     if remainder:
                         current_scene = remainder
@@ -285,7 +311,7 @@ def parse_script(ctx: PipelineContext) -> List[Segment]:
                     prev_scene = current_scene
             continue
 
-        matches = list(dialogue_pattern.finditer(line))
+        matches = list(DIALOGUE_PATTERN.finditer(line))
         entries: List[tuple[str, str]] = []
         if matches:
             for i, match in enumerate(matches):
@@ -565,7 +591,7 @@ def synthesize_segments(ctx: PipelineContext, segments: List[Segment]) -> None:
 
         text = script_texts.get(segment.index) or segment.raw_text or segment.text
 
-        if output_path.exists():
+        if output_path.exists() and output_path.stat().st_size >= MIN_AUDIO_BYTES:
             duration, sample_rate = probe_audio_metadata(output_path)
             segment.filename = output_name
             segment.audio_path = output_path
@@ -578,6 +604,11 @@ def synthesize_segments(ctx: PipelineContext, segments: List[Segment]) -> None:
                 f"{duration:.2f}s -> {relpath(output_path)} (cached)"
             )
             continue
+        if output_path.exists():
+            print(
+                f"[{segment.index:03d}] ⚠️  Regenerating truncated file: {output_name} "
+                f"({output_path.stat().st_size} bytes)"
+            )
 
         success = generator.generate(
             text=text,
@@ -609,6 +640,15 @@ def synthesize_segments(ctx: PipelineContext, segments: List[Segment]) -> None:
 
 
 def probe_audio_metadata(audio_path: Path) -> tuple[float, int]:
+    # Read the headers in-process when possible; ffprobe is the fallback
+    if MUTAGEN_AVAILABLE:
+        try:
+            audio = MutagenFile(str(audio_path))
+            if audio is not None and audio.info.length > 0:
+                return float(audio.info.length), int(audio.info.sample_rate)
+        except Exception as exc:
+            logger.debug("mutagen could not read %s: %s", audio_path, exc)
+
     cmd = [
         "ffprobe",
         "-v",
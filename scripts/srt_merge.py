@@ -6,6 +6,7 @@ import argparse
 import re
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable, List, Sequence
 
@@ -27,10 +28,11 @@ class Subtitle:
         return _time_to_ms(self.end_time)
 
     def char_count(self) -> int:
-        return len(re.sub(r"\s", "", self.text)) or 1
+        return len(_WHITESPACE_RE.sub("", self.text)) or 1
 
 
 _TIME_RE = re.compile(r"(\d+):(\d+):(\d+),(\d+)")
+_WHITESPACE_RE = re.compile(r"\s+")
 _PUNCT_RE = re.compile(r"[、。，．,.！？!？\s\n「」『』（）()【】——…・※★]")
 
 
@@ -84,13 +86,12 @@ def write_srt(subtitles: Sequence[Subtitle], path: Path) -> None:
     path.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
 
 
+@lru_cache(maxsize=4096)
 def _normalize(text: str) -> str:
     return _PUNCT_RE.sub("", text).lower()
 
 
-def _overlap_score(timed_text: str, group: Sequence[Subtitle]) -> float:
-    timed_norm = _normalize(timed_text)
-    group_norm = _normalize("".join(sub.text for sub in group))
+def _normalized_overlap_score(timed_norm: str, group_norm: str) -> float:
     if not timed_norm or not group_norm:
         return 0.0
     overlap = SequenceMatcher(None, timed_norm, group_norm).ratio()
@@ -110,14 +111,21 @@ def _choose_group(
     best_group: List[Subtitle] = [originals[start_idx]]
     best_score = 0.0
 
+    # Grow the group one subtitle at a time, extending the normalized text
+    # and char total instead of recomputing them for every candidate size
+    timed_norm = _normalize(timed_sub.text)
+    char_limit = timed_sub.char_count() * 1.5
+    norm_parts: List[str] = []
+    combined_chars = 0
     for size in range(1, min(max_group, len(originals) - start_idx) + 1):
-        group = list(originals[start_idx : start_idx + size])
-        score = _overlap_score(timed_sub.text, group)
-        combined_chars = sum(sub.char_count() for sub in group)
+        added = originals[start_idx + size - 1]
+        norm_parts.append(_normalize(added.text))
+        combined_chars += added.char_count()
+        score = _normalized_overlap_score(timed_norm, "".join(norm_parts))
         if score > best_score:
-            best_group = group
+            best_group = list(originals[start_idx : start_idx + size])
             best_score = score
-        if combined_chars > timed_sub.char_count() * 1.5:
+        if combined_chars > char_limit:
             break
 
     return best_group
@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
 import csv
+import hashlib
+import json
 import os
 import pathlib
+import shutil
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict
 
 
@@ -20,6 +27,9 @@ VOICE_MAP: Dict[str, str] = {
 DEFAULT_NA = 'WQz3clzUdMqvBf0jswZQ'  # Shizuka（日本語）
 DEFAULT_DL = 'YFkT3BsfOFWBx3jfroxH'  # Heyhey（汎用）
 
+# Cached files smaller than this are truncated/empty and are ignored
+MIN_AUDIO_BYTES = 1024
+
 
 def load_api_key() -> str | None:
     k = os.getenv('ELEVENLABS_API_KEY')
@@ -46,15 +56,61 @@ def resolve_voice_id(role: str, character: str) -> str:
     return DEFAULT_NA
 
 
+class RateLimiter:
+    """Minimum spacing between API calls, shared across worker threads."""
+
+    def __init__(self, max_per_sec: float):
+        self.interval = 1.0 / max_per_sec if max_per_sec > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def tts_cache_key(kwargs: dict) -> str:
+    """Content hash of a convert() request (text, voice, model, settings)."""
+    payload = json.dumps(kwargs, sort_keys=True, ensure_ascii=False)
+    return hashlib.md5(payload.encode('utf-8')).hexdigest()
+
+
+def store_in_cache(audio_path: pathlib.Path, cached: pathlib.Path) -> None:
+    """Copy audio into the cache atomically (unique temp file + os.replace)."""
+    fd, tmp_name = tempfile.mkstemp(dir=cached.parent, suffix='.tmp')
+    os.close(fd)
+    try:
+        shutil.copyfile(audio_path, tmp_name)
+        os.replace(tmp_name, cached)
+    except OSError:
+        pathlib.Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
 def main() -> int:
     if len(sys.argv) < 2:
-        print('Usage: python scripts/tts_from_csv.py <csv_path> [project_dir]', file=sys.stderr)
+        print(
+            'Usage: python scripts/tts_from_csv.py <csv_path> [project_dir] [--no-cache] '
+            '[--workers N] [--max-rps R] [--model ID] [--stability X] [--similarity X] '
+            '[--style X] [--na-voice-id ID] [--dl-voice-id ID]',
+            file=sys.stderr,
+        )
         return 2
     csv_path = pathlib.Path(sys.argv[1])
     if not csv_path.exists():
         print(f'CSV not found: {csv_path}', file=sys.stderr)
         return 3
-    project_dir = pathlib.Path(sys.argv[2]) if len(sys.argv) >= 3 else csv_path.parent.parent
+    # argv[2] is only the project dir when it is not the first option flag
+    if len(sys.argv) >= 3 and not sys.argv[2].startswith('--'):
+        project_dir = pathlib.Path(sys.argv[2])
+    else:
+        project_dir = csv_path.parent.parent
 
     api_key = load_api_key()
     if not api_key:
@@ -69,8 +125,14 @@ def main() -> int:
 
     out_dir = project_dir / 'サウンド類' / 'Narration'
     out_dir.mkdir(parents=True, exist_ok=True)
+    # Content-addressed cache: unchanged lines are copied instead of re-synthesized.
+    # --no-cache forces fresh synthesis (results still refresh the cache).
+    use_cache = '--no-cache' not in sys.argv
+    cache_dir = project_dir / '.cache' / 'tts'
+    cache_dir.mkdir(parents=True, exist_ok=True)
 
-    rows = list(csv.DictReader(csv_path.open('r', encoding='utf-8')))
+    with csv_path.open('r', encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
     # CLI options
     model_id = 'eleven_v3'
     if '--model' in sys.argv:
@@ -103,9 +165,22 @@ def main() -> int:
             dl_override = sys.argv[sys.argv.index('--dl-voice-id') + 1].strip()
         except Exception:
             dl_override = None
+    # Number of concurrent TTS requests (--workers N, default from TTS_CONCURRENCY)
+    try:
+        workers = int(os.getenv('TTS_CONCURRENCY', '4'))
+    except ValueError:
+        workers = 4
+    if '--workers' in sys.argv:
+        try:
+            workers = int(sys.argv[sys.argv.index('--workers') + 1])
+        except Exception:
+            pass
+    workers = max(1, workers)
+    # Optional request rate cap (--max-rps R) so bursts stay within plan limits; off by default
+    limiter = RateLimiter(get_opt('--max-rps', 0.0))
     client = ElevenLabs(api_key=api_key)
 
-    saved, errors = [], []
+    jobs: Dict[str, tuple] = {}
     for r in rows:
         num = (r.get('number') or '').zfill(3)
         role = r.get('role') or 'NA'
@@ -120,32 +195,70 @@ def main() -> int:
             vid = dl_override
         out_name = f"OrionEp2-{num}-{role.upper()}.mp3"
         out_path = out_dir / out_name
-        try:
-            kwargs = dict(
-                text=text,
-                voice_id=vid,
-                model_id=model_id,
-                output_format='mp3_44100_128',
-            )
-            # Attach voice settings when using multilingual model
-            if 'multilingual' in model_id:
-                kwargs['voice_settings'] = {
-                    'stability': stability,
-                    'similarity_boost': similarity,
-                    'style': style,
-                    'use_speaker_boost': bool(speaker_boost),
-                }
+        kwargs = dict(
+            text=text,
+            voice_id=vid,
+            model_id=model_id,
+            output_format='mp3_44100_128',
+        )
+        # Attach voice settings when using multilingual model
+        if 'multilingual' in model_id:
+            kwargs['voice_settings'] = {
+                'stability': stability,
+                'similarity_boost': similarity,
+                'style': style,
+                'use_speaker_boost': bool(speaker_boost),
+            }
+        # Identical requests (e.g. a repeated line in the same voice) are
+        # synthesized once and copied to every output that needs them
+        key = tts_cache_key(kwargs)
+        if key not in jobs:
+            jobs[key] = (kwargs, [])
+        jobs[key][1].append((num, role, character, out_path))
+
+    def synthesize(key: str, kwargs: dict, out_paths: list) -> list:
+        first, rest = out_paths[0], out_paths[1:]
+        cached = cache_dir / f"{key}.mp3"
+        if use_cache and cached.exists() and cached.stat().st_size >= MIN_AUDIO_BYTES:
+            shutil.copyfile(cached, first)
+        else:
+            limiter.wait()
             audio = client.text_to_speech.convert(**kwargs)
-            with out_path.open('wb') as f:
+            with first.open('wb') as f:
                 if isinstance(audio, (bytes, bytearray)):
                     f.write(audio)
                 else:
                     for chunk in audio:
                         if isinstance(chunk, (bytes, bytearray)):
                             f.write(chunk)
-            saved.append(str(out_path))
-        except Exception as e:
-            errors.append(f"{num} {role} {character}: {e}")
+            store_in_cache(first, cached)
+        for out_path in rest:
+            shutil.copyfile(first, out_path)
+        return [str(p) for p in out_paths]
+
+    saved, errors = [], []
+    total_lines = sum(len(lines) for _, lines in jobs.values())
+    pool = ThreadPoolExecutor(max_workers=workers)
+    futures = {
+        pool.submit(synthesize, key, kwargs, [line[3] for line in lines]): lines
+        for key, (kwargs, lines) in jobs.items()
+    }
+    try:
+        # Report lines as soon as they finish instead of in submit order
+        for future in as_completed(futures):
+            lines = futures[future]
+            try:
+                saved.extend(future.result())
+            except Exception as e:
+                errors.extend(f"{num} {role} {character}: {e}" for num, role, character, _ in lines)
+    except KeyboardInterrupt:
+        # Ctrl+C: drop queued lines instead of waiting for every request
+        pool.shutdown(wait=False, cancel_futures=True)
+        print(f'Interrupted: {len(saved)} saved, {total_lines - len(saved) - len(errors)} cancelled', file=sys.stderr)
+        return 130
+    pool.shutdown()
+    saved.sort()
+    errors.sort()
 
     print('SAVED:')
     for p in saved: